@@ -81,9 +81,14 @@ def delete_bot(bot_id):
   bot_info_key = bot_management.get_info_key(bot_id)
   _get_or_raise(bot_info_key)  # raises 404 if there is no such bot
   # It is important to note that the bot is not there anymore, so it is not
-  # a member of any task queue.
-  task_queues.cleanup_after_bot(bot_id)
-  bot_info_key.delete()
+  # a member of any task queue. Issue both deletes concurrently so ndb batches
+  # them into a single RPC.
+  futures = [
+      task_queues.cleanup_after_bot_async(bot_id),
+      bot_info_key.delete_async(),
+  ]
+  for f in futures:
+    f.get_result()
 
 
 def get_bot_events(bot_id, start, end, limit, cursor):
@@ -607,6 +612,15 @@ def count_bots(dimensions):
   pools = bot_management.get_pools_from_dimensions_flat(dimensions)
   realms.check_bots_list_acl(pools)
 
+  # The counts are polled by dashboards; running the five count queries on
+  # every call is wasteful, so results are cached for a short time.
+  # The key must not be a '|' join, since '|' is also the OR separator within
+  # a dimension value.
+  mem_key = utils.encode_to_json(sorted(dimensions))
+  cached = memcache.get(mem_key, namespace='bots_count')
+  if cached is not None:
+    return BotsCount(*cached)
+
   q = bot_management.BotInfo.query()
   try:
     q = bot_management.filter_dimensions(q, dimensions)
@@ -622,11 +636,13 @@ def count_bots(dimensions):
                                                      None).count_async()
   f_busy = bot_management.filter_availability(q, None, None, None,
                                               True).count_async()
-  return BotsCount(count=f_count.get_result(),
-                   dead=f_dead.get_result(),
-                   quarantined=f_quarantined.get_result(),
-                   maintenance=f_maintenance.get_result(),
-                   busy=f_busy.get_result())
+  bc = BotsCount(count=f_count.get_result(),
+                 dead=f_dead.get_result(),
+                 quarantined=f_quarantined.get_result(),
+                 maintenance=f_maintenance.get_result(),
+                 busy=f_busy.get_result())
+  memcache.add(mem_key, tuple(bc), 60, namespace='bots_count')
+  return bc
 
 
 def _memcache_key(filters, now):
@@ -770,7 +786,7 @@ def get_server_details():
   server_version = utils.get_app_version()
 
   return ServerDetails(
-      bot_version=bot_code.get_bot_version(bot_code.STABLE_BOT)[0],
+      bot_version=bot_code.get_bot_version(bot_code.STABLE_BOT, cached=True)[0],
       server_version=server_version,
       display_server_url_template=cfg.display_server_url_template,
       luci_config=config.config.config_service_hostname(),
@@ -826,10 +842,17 @@ def get_permissions(bot_id, task_id, tags):
   Returns:
     ClientPermissions named tuple.
   """
-  pools_list_bots = [p for p in pools_config.known() if realms.can_list_bots(p)]
-  pools_list_tasks = [
-      p for p in pools_config.known() if realms.can_list_tasks(p)
-  ]
+  known_pools = pools_config.known()
+  # Check the global permissions once instead of once per pool inside
+  # realms.can_list_bots() and realms.can_list_tasks().
+  if acl.can_view_bot():
+    pools_list_bots = known_pools
+  else:
+    pools_list_bots = [p for p in known_pools if realms.can_list_bots(p)]
+  if acl.can_view_all_tasks():
+    pools_list_tasks = known_pools
+  else:
+    pools_list_tasks = [p for p in known_pools if realms.can_list_tasks(p)]
   pool_tags = bot_management.get_pools_from_dimensions_flat(tags)
   return ClientPermissions(delete_bot=realms.can_delete_bot(bot_id),
                            delete_bots=realms.can_delete_bots(pool_tags),
@@ -464,9 +464,12 @@ class _BotBaseHandler(_BotApiHandler):
           isinstance(dimension_id[0], unicode)):
         bot_id = dimensions['id'][0]
 
+    # BotSettings is only needed for the admin quarantine check at the very
+    # end, fetch it concurrently with the authentication and config lookups.
+    bot_settings_future = None
     if bot_id:
       logging.debug('Fetching bot settings for bot id: %s', bot_id)
-      bot_settings = bot_management.get_settings_key(bot_id).get()
+      bot_settings_future = bot_management.get_settings_key(bot_id).get_async()
 
     # Make sure bot self-reported ID matches the authentication token. Raises
     # auth.AuthorizationError if not.
@@ -548,6 +551,8 @@ class _BotBaseHandler(_BotApiHandler):
       return result
 
     # Look for admin enforced quarantine.
+    bot_settings = (
+        bot_settings_future.get_result() if bot_settings_future else None)
     if bool(bot_settings and bot_settings.quarantined):
       result.quarantined_msg = 'Quarantined by admin'
       return result
@@ -666,7 +671,10 @@ class _BotBaseHandler(_BotApiHandler):
         'bot_dimensions':
         bot_request_info.dimensions,
     }
-    return utils.to_json_encodable(out)
+    # All the values above are already JSON serializable (str, unicode, int,
+    # list and dict), so skip the recursive utils.to_json_encodable() walk and
+    # let send_response() serialize the dict in a single json.dumps() pass.
+    return out
 
 
 class BotHandshakeHandler(_BotBaseHandler):
@@ -911,13 +919,10 @@ class BotPollHandler(_BotBaseHandler):
       self._cmd_sleep(session_token, sleep_streak, True)
       return
 
-    bot_info = bot_management.get_info_key(res.bot_id).get(use_cache=False,
-                                                           use_memcache=False)
-    # TODO(crbug.com/1077188):
-    #   avoid assigning to bots with another task assigned.
-    if bot_info and bot_info.task_id:
-      logging.error('Task %s is already assigned to the bot %s',
-                    bot_info.task_id, res.bot_id)
+    # BotInfo is only used for diagnostics below. Fetch it concurrently with
+    # the scheduler RPCs instead of blocking on it first.
+    bot_info_future = bot_management.get_info_key(res.bot_id).get_async(
+        use_cache=False, use_memcache=False)
 
     # The bot is in good shape.
 
@@ -969,6 +974,13 @@ class BotPollHandler(_BotBaseHandler):
       except self.TIMEOUT_EXCEPTIONS as e:
         self.abort_by_timeout('bot_reap_task', e)
 
+    bot_info = bot_info_future.get_result()
+    # TODO(crbug.com/1077188):
+    #   avoid assigning to bots with another task assigned.
+    if bot_info and bot_info.task_id:
+      logging.error('Task %s is already assigned to the bot %s',
+                    bot_info.task_id, res.bot_id)
+
     if not request:
       # No tasks found in the Swarming scheduler or not using it at all.
       if not res.rbe_instance:
@@ -1739,21 +1751,13 @@ def get_routes():
         ('/python' + route, handler),
     ])
 
-  # Generic handlers (no auth)
-  add('/swarming/api/v1/bot/server_ping', ServerPingHandler)
-
-  # Bot code (bootstrap and swarming_bot.zip) handlers
-  add('/bootstrap', BootstrapHandler)
-  add('/bot_code', BotCodeHandler)
-  # 40 for old sha1 digest so old bot can still update, 64 for current
-  # sha256 digest.
-  add('/swarming/api/v1/bot/bot_code/<version:[0-9a-f]{40,64}>', BotCodeHandler)
+  # Routes are matched in order, so the most frequently hit ones go first.
 
   # Bot API RPCs
 
   # Bot Session API RPC handlers
-  add('/swarming/api/v1/bot/handshake', BotHandshakeHandler)
   add('/swarming/api/v1/bot/poll', BotPollHandler)
+  add('/swarming/api/v1/bot/handshake', BotHandshakeHandler)
   add('/swarming/api/v1/bot/claim', BotClaimHandler)
   add('/swarming/api/v1/bot/event', BotEventHandler)
 
@@ -1769,4 +1773,14 @@ def get_routes():
   add('/swarming/api/v1/bot/task_error/<task_id:[a-f0-9]+>',
       BotTaskErrorHandler)
 
+  # Generic handlers (no auth)
+  add('/swarming/api/v1/bot/server_ping', ServerPingHandler)
+
+  # Bot code (bootstrap and swarming_bot.zip) handlers
+  add('/bootstrap', BootstrapHandler)
+  add('/bot_code', BotCodeHandler)
+  # 40 for old sha1 digest so old bot can still update, 64 for current
+  # sha256 digest.
+  add('/swarming/api/v1/bot/bot_code/<version:[0-9a-f]{40,64}>', BotCodeHandler)
+
   return [webapp2.Route(*i) for i in routes]
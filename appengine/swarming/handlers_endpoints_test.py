@@ -19,6 +19,7 @@ from parameterized import parameterized
 import test_env_handlers
 from test_support import test_case
 
+from google.appengine.api import memcache
 from google.appengine.ext import ndb
 from protorpc.remote import protojson
 import webapp2
@@ -2826,6 +2827,10 @@ class BotsApiTest(BaseTest):
     response = self.call_api('count', body=message_to_dict(request))
     self.assertEqual(expected, response.json)
     self.assertEqual(1, bot_management.cron_update_bot_info())
+    # The previous counts are still cached.
+    response = self.call_api('count', body=message_to_dict(request))
+    self.assertEqual(expected, response.json)
+    memcache.flush_all()
     expected[u'dead'] = u'1'
     response = self.call_api('count', body=message_to_dict(request))
     self.assertEqual(expected, response.json)
@@ -33,6 +33,9 @@ ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 # Helper class for displaying the sort options in html templates.
 SortOptions = collections.namedtuple('SortOptions', ['key', 'name'])
 
+# Rendered UI landing pages, keyed by (page, client_id, google_analytics).
+_UI_PAGES_CACHE = {}
+
 
 ### is_admin pages.
 
@@ -114,19 +117,26 @@ class UIHandler(auth.AuthenticatingHandler):
   def get(self, page):
     page = page or 'swarming'
 
-    params = {
-      'client_id': config.settings().ui_client_id,
-    }
+    settings = config.settings()
+    # The rendered page only depends on these values, so it is rendered once
+    # per instance.
+    key = (page, settings.ui_client_id, settings.google_analytics)
+    html = _UI_PAGES_CACHE.get(key)
+    if html is None:
+      params = {
+        'client_id': settings.ui_client_id,
+      }
+      try:
+        html = template.render('wcui/public_%s_index.html' % page, params)
+      except template.TemplateNotFound:
+        self.abort(404, 'Page %s not found.', page)
+      _UI_PAGES_CACHE[key] = html
     # Can cache for 1 week, because the only thing that would change in this
     # template is the oauth client id, which changes very infrequently.
     self.response.cache_control.no_cache = None
     self.response.cache_control.public = True
     self.response.cache_control.max_age = 604800
-    try:
-      self.response.write(template.render(
-        'wcui/public_%s_index.html' % page, params))
-    except template.TemplateNotFound:
-      self.abort(404, 'Page %s not found.', page)
+    self.response.write(html)
 
   def get_content_security_policy(self):
     # We use iframes to display pages at display_server_url_template. Need to
@@ -203,8 +213,9 @@ def get_routes():
 
 
 def create_application(debug):
+  # Bot routes are by far the most frequently hit, match them first.
   routes = []
-  routes.extend(get_routes())
   routes.extend(handlers_bot.get_routes())
+  routes.extend(get_routes())
   routes.extend(handlers_endpoints.get_routes())
   return webapp2.WSGIApplication(routes, debug=debug)
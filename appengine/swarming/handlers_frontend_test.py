@@ -17,13 +17,16 @@ import webtest
 
 import handlers_frontend
 import template
+from proto.config import config_pb2
 from server import bot_code
+from server import config
 
 
 class FrontendTest(test_env_handlers.AppTestBase):
   def setUp(self):
     super(FrontendTest, self).setUp()
     template.bootstrap()
+    handlers_frontend._UI_PAGES_CACHE.clear()
     # By default requests in tests are coming from bot with fake IP.
     self.app = webtest.TestApp(
         handlers_frontend.create_application(True),
@@ -42,6 +45,30 @@ class FrontendTest(test_env_handlers.AppTestBase):
     response = self.app.get('/', status=200)
     self.assertGreater(len(response.body), 0)
 
+  def test_ui_page_cached(self):
+    cfg = config_pb2.SettingsCfg(ui_client_id='client-a')
+    self.mock(config, 'settings', lambda: cfg)
+    rendered = []
+    render = template.render
+    def render_mock(name, params=None):
+      rendered.append((name, params['client_id']))
+      return render(name, params)
+    self.mock(template, 'render', render_mock)
+
+    first = self.app.get('/', status=200).body
+    second = self.app.get('/', status=200).body
+    self.assertEqual(first, second)
+    self.assertEqual(
+        [('wcui/public_swarming_index.html', 'client-a')], rendered)
+
+    # A new client id is rendered anew.
+    cfg.ui_client_id = 'client-b'
+    self.app.get('/', status=200)
+    self.assertEqual([
+        ('wcui/public_swarming_index.html', 'client-a'),
+        ('wcui/public_swarming_index.html', 'client-b'),
+    ], rendered)
+
   def test_all_swarming_handlers_secured(self):
     # Test that all handlers are accessible only to authenticated user or
     # bots. Assumes all routes are defined with plain paths (i.e.
@@ -18,6 +18,7 @@ from parameterized import parameterized
 
 import test_env_handlers
 
+from google.appengine.api import memcache
 from google.appengine.ext import ndb
 import google.protobuf as proto
 
@@ -1008,6 +1009,14 @@ class BotServicePrpcTest(PrpcTest):
             dead=0,
             busy=4)
     self.assertEqual(1, bot_management.cron_update_bot_info())
+    # The previous counts are still cached.
+    _verify(dimensions=[],
+            count=4,
+            quarantined=2,
+            maintenance=1,
+            dead=0,
+            busy=4)
+    memcache.flush_all()
     _verify(dimensions=[],
             count=4,
             quarantined=2,
@@ -1043,6 +1052,25 @@ class BotServicePrpcTest(PrpcTest):
             count=1)
     _verify(dimensions=[swarming_pb2.StringPair(key='non', value='existing')])
 
+  def test_count_cache_key_or_dimension(self):
+    # An OR filter and an AND filter that would look alike once joined with
+    # '|' must not share a cache entry.
+    self.set_as_privileged_user()
+    _bot_event('request_sleep', bot_id='id1')
+    _bot_event('request_sleep', bot_id='id2')
+
+    def _count(dimensions):
+      request = swarming_pb2.BotsCountRequest(dimensions=[
+          swarming_pb2.StringPair(key=k, value=v) for k, v in dimensions
+      ])
+      resp = self.post_prpc('CountBots', request)
+      actual = swarming_pb2.BotsCount()
+      _decode(resp.body, actual)
+      return actual.count
+
+    self.assertEqual(1, _count([('id', 'id1|id:id2')]))
+    self.assertEqual(0, _count([('id', 'id1'), ('id', 'id2')]))
+
   def test_count_bad_request(self):
     self.set_as_privileged_user()
 
@@ -118,20 +118,23 @@ def get_bot_channel(bot_id, settings):
   return STABLE_BOT
 
 
-def get_bot_version(channel):
+def get_bot_version(channel, cached=False):
   """Returns a concrete version digest for the given release channel.
 
   Args:
     channel: either CANARY_BOT or STABLE_BOT.
+    cached: if True, the value may be up to 10 seconds stale. Must not be used
+        to tell a bot which version to run: during a rollout an instance with a
+        stale value would ask already updated bots to go back to the previous
+        version.
 
   Returns:
     (A bot archive digest, revision of bot_config.py embedded inside).
   """
   assert channel in (STABLE_BOT, CANARY_BOT), channel
-  info = config_bundle_rev_key().get()
-  if channel == STABLE_BOT:
-    return (info.stable_bot.digest, info.stable_bot.bot_config_rev)
-  return (info.canary_bot.digest, info.canary_bot.bot_config_rev)
+  if cached:
+    return _get_bot_versions_cached()[channel]
+  return _get_bot_versions()[channel]
 
 
 def get_bootstrap(host_url, bootstrap_token=None):
@@ -280,6 +283,24 @@ def validate_bootstrap_token(tok):
 ### Private code
 
 
+def _get_bot_versions():
+  """Returns a dict {channel: (digest, bot_config_rev)} from ConfigBundleRev."""
+  info = config_bundle_rev_key().get()
+  return {
+      STABLE_BOT: (info.stable_bot.digest, info.stable_bot.bot_config_rev),
+      CANARY_BOT: (info.canary_bot.digest, info.canary_bot.bot_config_rev),
+  }
+
+
+@utils.cache_with_expiration(10)
+def _get_bot_versions_cached():
+  """Same as _get_bot_versions() but kept in memory for a few seconds.
+
+  Only for informational uses, like the server details API.
+  """
+  return _get_bot_versions()
+
+
 def _quasi_random_100(s):
   """Given a string, returns a quasi-random integer in range [0; 100)."""
   # Use some seed to avoid being in sync with a similar generator in rbe.py.
@@ -15,6 +15,7 @@ from components import auth
 from test_support import test_case
 
 from components import config
+from components import utils
 from proto.config import config_pb2
 from server import bot_code
 
@@ -33,6 +34,7 @@ class BotManagementTest(test_case.TestCase):
   def setUp(self):
     super(BotManagementTest, self).setUp()
     self.testbed.init_user_stub()
+    utils.clear_cache(bot_code._get_bot_versions_cached)
 
     self.mock(
         auth, 'get_current_identity',
@@ -73,6 +75,31 @@ class BotManagementTest(test_case.TestCase):
         ('canary-digest', 'canary-rev'),
     )
 
+  def test_get_bot_version_rollout(self):
+    def put(digest):
+      bot_code.ConfigBundleRev(
+          key=bot_code.config_bundle_rev_key(),
+          stable_bot=bot_code.BotArchiveInfo(digest=digest,
+                                             bot_config_rev='rev'),
+          canary_bot=bot_code.BotArchiveInfo(digest=digest,
+                                             bot_config_rev='rev'),
+      ).put()
+
+    put('old-digest')
+    self.assertEqual(('old-digest', 'rev'),
+                     bot_code.get_bot_version(bot_code.STABLE_BOT, cached=True))
+    put('new-digest')
+    # The version used to decide whether a bot should update is never stale,
+    # so bots that already updated are not asked to go back.
+    self.assertEqual(('new-digest', 'rev'),
+                     bot_code.get_bot_version(bot_code.STABLE_BOT))
+    # The informational value lags behind until the cache expires.
+    self.assertEqual(('old-digest', 'rev'),
+                     bot_code.get_bot_version(bot_code.STABLE_BOT, cached=True))
+    utils.clear_cache(bot_code._get_bot_versions_cached)
+    self.assertEqual(('new-digest', 'rev'),
+                     bot_code.get_bot_version(bot_code.STABLE_BOT, cached=True))
+
   def test_get_bootstrap(self):
     def get_self_config_mock(path, revision=None, store_last_good=False):
       self.assertEqual('scripts/bootstrap.py', path)
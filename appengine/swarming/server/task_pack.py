@@ -83,10 +83,13 @@ def get_request_and_result_keys(task_id):
   Raises:
     ValueError if the task_id is in an unexpected format.
   """
-  try:
+  # The last character is the try number: '0' for a TaskResultSummary and
+  # non-zero for a TaskRunResult. Branch on it directly instead of trying one
+  # unpacking and falling back to the other on ValueError.
+  if task_id[-1:] == '0':
     key = unpack_result_summary_key(task_id)
     request_key = result_summary_key_to_request_key(key)
-  except ValueError:
+  else:
     key = unpack_run_result_key(task_id)
     request_key = result_summary_key_to_request_key(
         run_result_key_to_result_summary_key(key))
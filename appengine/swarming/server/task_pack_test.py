@@ -161,8 +161,22 @@ class TaskPackApiTest(test_case.TestCase):
       task_pack.unpack_run_result_key('bb80203')
 
   def test_get_request_and_result_keys(self):
-    # Moved here, but tested in handlers_endpoints_test.py
-    pass
+    request_key = ndb.Key('TaskRequest', 0x7fffffffff447fde)
+    result_summary_key = ndb.Key(
+        'TaskRequest', 0x7fffffffff447fde, 'TaskResultSummary', 1)
+    run_result_key = ndb.Key('TaskRequest', 0x7fffffffff447fde,
+                             'TaskResultSummary', 1, 'TaskRunResult', 1)
+    self.assertEqual((request_key, result_summary_key),
+                     task_pack.get_request_and_result_keys('bb80210'))
+    self.assertEqual((request_key, run_result_key),
+                     task_pack.get_request_and_result_keys('bb80211'))
+
+    with self.assertRaises(ValueError):
+      task_pack.get_request_and_result_keys('')
+    with self.assertRaises(ValueError):
+      task_pack.get_request_and_result_keys('0')
+    with self.assertRaises(ValueError):
+      task_pack.get_request_and_result_keys('bb80200')
 
 
 if __name__ == '__main__':
@@ -1391,7 +1391,16 @@ def cleanup_after_bot(bot_id):
   Arguments:
     bot_id: ID of the bot to unregister.
   """
-  ndb.Key(BotDimensionsMatches, bot_id).delete()
+  cleanup_after_bot_async(bot_id).get_result()
+
+
+def cleanup_after_bot_async(bot_id):
+  """Async version of cleanup_after_bot.
+
+  Returns:
+    ndb.Future that resolves once the registration is removed.
+  """
+  return ndb.Key(BotDimensionsMatches, bot_id).delete_async()
 
 
 @ndb.tasklet
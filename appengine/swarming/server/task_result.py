@@ -81,6 +81,9 @@ from server import task_pack
 from server import task_request
 from server.constants import OR_DIM_SEP
 
+# These are the fields which we are allowed to sort TaskResultSummary and
+# TaskRunResult by.
+_ALLOWED_SORTS = {'created_ts', 'completed_ts', 'abandoned_ts', 'started_ts'}
 # These are the fields which we are allowed to sort TaskRunResult by.
 # They are the only states which have a composite index with bot_id field.
 _BOT_TASK_ALLOWED_SORTS = {'created_ts', 'started_ts', 'completed_ts'}
@@ -1463,7 +1466,7 @@ def _outputchunk_key_to_request(output_chunk_key):
 
 def _sort_property(sort):
   """Returns a datastore_query.PropertyOrder based on 'sort'."""
-  if sort not in ('created_ts', 'completed_ts', 'abandoned_ts', 'started_ts'):
+  if sort not in _ALLOWED_SORTS:
     raise ValueError('Unexpected sort %r' % sort)
   if sort == 'created_ts':
     return datastore_query.PropertyOrder(
@@ -1480,6 +1483,49 @@ def _datetime_to_key(date):
   return task_request.convert_to_request_key(date)
 
 
+# Maps a state filter string to a function that applies it to a query on
+# TaskResultSummary or TaskRunResult.
+# pylint: disable=singleton-comparison
+_STATE_FILTERS = {
+    'all':
+    lambda cls, q: q,
+    'pending':
+    lambda cls, q: q.filter(cls.state == State.PENDING),
+    'running':
+    lambda cls, q: q.filter(cls.state == State.RUNNING),
+    # cls.state <= State.PENDING would work.
+    'pending_running':
+    lambda cls, q: q.filter(
+        ndb.OR(cls.state == State.PENDING, cls.state == State.RUNNING)),
+    'completed':
+    lambda cls, q: q.filter(cls.state == State.COMPLETED),
+    'completed_success':
+    lambda cls, q: q.filter(cls.state == State.COMPLETED).filter(
+        cls.failure == False),
+    'completed_failure':
+    lambda cls, q: q.filter(cls.state == State.COMPLETED).filter(
+        cls.failure == True),
+    'deduped':
+    lambda cls, q: q.filter(cls.state == State.COMPLETED).filter(
+        cls.try_number == 0),
+    'expired':
+    lambda cls, q: q.filter(cls.state == State.EXPIRED),
+    'timed_out':
+    lambda cls, q: q.filter(cls.state == State.TIMED_OUT),
+    'bot_died':
+    lambda cls, q: q.filter(cls.state == State.BOT_DIED),
+    'client_error':
+    lambda cls, q: q.filter(cls.state == State.CLIENT_ERROR),
+    'canceled':
+    lambda cls, q: q.filter(cls.state == State.CANCELED),
+    'killed':
+    lambda cls, q: q.filter(cls.state == State.KILLED),
+    'no_resource':
+    lambda cls, q: q.filter(cls.state == State.NO_RESOURCE),
+}
+# pylint: enable=singleton-comparison
+
+
 ### Public API.
 
 
@@ -1498,61 +1544,10 @@ def filter_query(cls, q, start, end, sort, state):
   if sort != 'created_ts' and (start or end):
     raise ValueError('Cannot both sort and use timestamp filtering')
 
-  if state == 'all':
-    return q
-
-  if state == 'pending':
-    return q.filter(cls.state == State.PENDING)
-
-  if state == 'running':
-    return q.filter(cls.state == State.RUNNING)
-
-  if state == 'pending_running':
-    # cls.state <= State.PENDING would work.
-    return q.filter(
-        ndb.OR(
-            cls.state == State.PENDING,
-            cls.state == State.RUNNING))
-
-  if state == 'completed':
-    return q.filter(cls.state == State.COMPLETED)
-
-  if state == 'completed_success':
-    q = q.filter(cls.state == State.COMPLETED)
-    # pylint: disable=singleton-comparison
-    return q.filter(cls.failure == False)
-
-  if state == 'completed_failure':
-    q = q.filter(cls.state == State.COMPLETED)
-    # pylint: disable=singleton-comparison
-    return q.filter(cls.failure == True)
-
-  if state == 'deduped':
-    q = q.filter(cls.state == State.COMPLETED)
-    return q.filter(cls.try_number == 0)
-
-  if state == 'expired':
-    return q.filter(cls.state == State.EXPIRED)
-
-  if state == 'timed_out':
-    return q.filter(cls.state == State.TIMED_OUT)
-
-  if state == 'bot_died':
-    return q.filter(cls.state == State.BOT_DIED)
-
-  if state == 'client_error':
-    return q.filter(cls.state == State.CLIENT_ERROR)
-
-  if state == 'canceled':
-    return q.filter(cls.state == State.CANCELED)
-
-  if state == 'killed':
-    return q.filter(cls.state == State.KILLED)
-
-  if state == 'no_resource':
-    return q.filter(cls.state == State.NO_RESOURCE)
-
-  raise ValueError('Invalid state %s' % state)
+  state_filter = _STATE_FILTERS.get(state)
+  if not state_filter:
+    raise ValueError('Invalid state %s' % state)
+  return state_filter(cls, q)
 
 
 def state_to_string(state_obj):
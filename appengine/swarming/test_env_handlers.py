@@ -143,6 +143,8 @@ class AppTestBase(test_case.TestCase):
         data=data,
     ).put()
 
+    utils.clear_cache(bot_code._get_bot_versions_cached)
+
     put_chunk('stable:1', 'stable-1234+')
     put_chunk('stable:2', 'stable-5678')
     put_chunk('canary:1', 'canary-1234+')